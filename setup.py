@@ -7,6 +7,21 @@ if __name__ != '__main__':
 
 README = Path('./README.md')
 
+# Compile performance-critical pure-Python modules into C extensions if Cython is available,
+#   otherwise the package is installed as is and these modules are run by the interpreter
+# Cython is not a declared build requirement, so it is only visible with `pip install --no-build-isolation`
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    extensions = []
+else:
+    extensions = cythonize(
+            ['utils/typechecking.py'],
+            language_level=3,
+            compiler_directives={'annotation_typing': False},  # annotations are documentation-only here
+            quiet=True,
+    )
+
 setup(
         name="utils",
         version="1.2",
@@ -18,6 +33,7 @@ setup(
         url='https://github.com/GlebMorgan/PyUtils',
 
         packages=['utils'],
+        ext_modules=extensions,
         python_requires='>=3.8.0',
         install_requires=['wrapt'],
         extras_require={'test': ['pytest', 'pytest-lazy-fixture']},
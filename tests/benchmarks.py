@@ -23,7 +23,7 @@ class Benchmark:
         just one single element if function accepts a single argument)
     Lists of arguments are iterated over and acquired arguments are passed into target function
     In order to run a benchmark, instantiate required `Benchmark` and call its `.run()` method
-    >>> benchmark = BenchmarkBytewise(10000, bytes_range=(200, 250), limit=10)
+    >>> benchmark = BenchmarkBitsExtract(10000)
     >>> benchmark.run(times=3)
     """
 
@@ -97,25 +97,6 @@ class BenchmarkBitsExtract(Benchmark):
         print(*(f'{bin(item[0]).ljust(18)} {item[1]}' for item in self.data[:n]), sep='\n')
 
 
-class BenchmarkBytewise(Benchmark):
-
-    __id__ = 'bytewise'
-
-    def __init__(self, dataset_size: int, bytes_range: Tuple[int, int] = None, **kwargs):
-        from utils.utils import bytewise, bytewise2
-        functions = bytewise, bytewise2
-        self.range: Tuple[int, int] = bytes_range
-        super().__init__(dataset_size, functions, **kwargs)
-
-    def generate_args(self, n: int):
-        print(f"Generating test data set: {n} items")
-        gen_range = lambda: range(randint(*(self.range or (10, 255))))
-        return tuple((bytes(randint(0, 255) for _ in gen_range()),) for _ in range(n))
-
-    def show_args(self, n: int):
-        print(*(f'{item.hex()} (len={len(item)})' for item in self.data[:n]), sep='\n')
-
-
 if __name__ == '__main__':
 
     parser = ArgumentParser(description="Compare performance of two functions/methods")
@@ -133,7 +114,6 @@ if __name__ == '__main__':
 
     benchmarks = {
         'extract': BenchmarkBitsExtract,
-        'bytewise': BenchmarkBytewise,
     }
 
     if cmd.list:
@@ -141,7 +121,7 @@ if __name__ == '__main__':
         sys.exit()
 
     if not cmd.bench:
-        benchmark = BenchmarkBytewise(10000, bytes_range=(200, 250), limit=10)
+        benchmark = BenchmarkBitsExtract(10000)
         benchmark.run()
 
     else:
@@ -1,10 +1,12 @@
 from __future__ import annotations as _
 
 import asyncio
+import inspect
 from collections import defaultdict
 from contextlib import contextmanager, asynccontextmanager
 from enum import Enum
 from functools import partial
+from io import BytesIO, StringIO
 from itertools import repeat, chain
 from operator import itemgetter
 from random import choices, randint, choice
@@ -568,6 +570,7 @@ class _NamedTuple_(Tester):
     nt = NT(a=1, b='s', c=1.0)
     full_nt = NT(a=2, b='ss', c=[1, 2, 3], d=str, e=False)
     FakeNT = type('FakeNT', (), {'_fields': (), '_field_defaults': ()})
+    SubNT = type('SubNT', (NT,), {})
 
     @classmethod
     def ok(cls):
@@ -575,6 +578,8 @@ class _NamedTuple_(Tester):
         yield cls.full_nt, NT
         yield cls.nt, NamedTuple
         yield cls.full_nt, NamedTuple
+        yield cls.SubNT(a=1, b='s', c=1.0), NT
+        yield cls.SubNT(a=1, b='s', c=1.0), NamedTuple
 
     @classmethod
     def fail(cls):
@@ -733,9 +738,13 @@ class _Type_(Tester):
         yield type('STP', (), {'meth': lambda self: None}), Type[SP]
         yield NamedTuple, Type[NamedTuple]
         yield NT, Type[NamedTuple]
+        yield _NamedTuple_.SubNT, Type[NamedTuple]
         yield NT, Type[NT]
         yield dict, Type[Dict]
         yield NT, Type[tuple]
+        yield StringIO, Type[TextIO]
+        yield BytesIO, Type[BinaryIO]
+        yield BytesIO, Type[IO]
 
     @classmethod
     def fail(cls):
@@ -754,6 +763,9 @@ class _Type_(Tester):
         yield tuple, Type[NamedTuple]
         yield _NamedTuple_.nt, Type[NamedTuple]
         yield NamedTuple, Type[NT]
+        yield int, Type[IO]
+        yield BytesIO, Type[TextIO]
+        yield StringIO, Type[BinaryIO]
         # do not even try treat TypeVar bound types or constraints as anchors for typechecking
         # TypeVar object is simply not a type and thus Type[T] is an error
         yield T, Type[TypeVar]
@@ -1064,6 +1076,48 @@ class TestCheckArgs:
         with raises(TypecheckError, match="argument 'a': None is not int"):
             meth(*args, **kwargs)
 
+    def test_annotated_receiver(self):
+        class Receiver:
+            @check_args
+            def method(self: int, a: int):
+                return a
+
+            @check_args
+            @classmethod
+            def class_method(cls: int, a: int):
+                return a
+
+        assert Receiver().method(1) == 1
+        assert Receiver.class_method(1) == 1
+        with raises(TypecheckError, match="argument 'a': 's' is not int"):
+            Receiver().method('s')
+        with raises(TypecheckError, match="argument 'a': 's' is not int"):
+            Receiver.class_method('s')
+
+    def test_coroutine_function(self):
+        @check_args
+        async def coroutine_function(a: int):
+            return a
+
+        assert inspect.iscoroutinefunction(coroutine_function)
+        assert asyncio.run(coroutine_function(1)) == 1
+        with raises(TypecheckError, match="argument 'a': 's' is not int"):
+            asyncio.run(coroutine_function('s'))
+
+    def test_generator_function(self):
+        @check_args
+        def generator_function(a: int):
+            yield a
+
+        assert inspect.isgeneratorfunction(generator_function)
+        assert list(generator_function(1)) == [1]
+        with raises(TypecheckError, match="argument 'a': 's' is not int"):
+            generator_function('s')
+
+    def test_error_repr(self):
+        error = TypecheckError(value=None, exptype=int, varname='a')
+        assert repr(error) == "TypecheckError(\"argument 'a': None is not int\")"
+
     def test_decorator(self, case_decorator):
         dec = case_decorator(1, 's', 2.5)
         wrapee = dec(min)
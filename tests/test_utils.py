@@ -1,5 +1,6 @@
+from asyncio import run
 from string import printable
-from inspect import signature
+from inspect import signature, iscoroutinefunction, isgeneratorfunction
 from itertools import islice
 from operator import itemgetter
 from random import choices
@@ -191,6 +192,50 @@ class TestDeprecated:
         assert all(equal for attr in attrs if hasattr(original, attr))
         assert signature(decorated) == signature(original)
 
+    def test_deprecated_method(self):
+        class Class:
+            @deprecated('reason')
+            def method(self, arg):
+                return arg
+
+        with warns(DeprecationWarning, match=r"^Method 'method' is marked as deprecated \(reason\)$"):
+            assert Class().method(42) == 42
+        with warns(DeprecationWarning, match=r"^Function 'func' is marked as deprecated$"):
+            deprecated(self.get_func())(3.2, 'result=', d=True)
+
+    def test_deprecated_stacklevel(self):
+        @deprecated
+        class DeprecatedClass:
+            @deprecated('reason')
+            def method(self):
+                pass
+
+        function = deprecated(self.get_func())
+        callers = (
+            lambda: function(3.2, 'result=', d=True),
+            lambda: DeprecatedClass.__wrapped__().method(),
+            lambda: DeprecatedClass(),
+        )
+        for caller in callers:
+            with warns(DeprecationWarning) as record:
+                caller()
+            assert record[0].filename == __file__
+            assert record[0].lineno == caller.__code__.co_firstlineno
+
+    def test_deprecated_function_kind(self):
+        async def coroutine_function():
+            return 42
+
+        def generator_function():
+            yield 42
+
+        with warns(DeprecationWarning):
+            assert run(deprecated(coroutine_function)()) == 42
+        with warns(DeprecationWarning):
+            assert list(deprecated('reason')(generator_function)()) == [42]
+        assert iscoroutinefunction(deprecated(coroutine_function))
+        assert isgeneratorfunction(deprecated('reason')(generator_function))
+
 
 class TestAutorepr:
 
@@ -676,6 +721,19 @@ class TestTree:
         with raises(RuntimeError, match=err_msg):
             Tree.convert(root_item, name_handle, children_handle)
 
+    def test_convert_cycle_references(self, name_handle, children_handle):
+        a = self.Item('a')
+        b = self.Item('b', [self.Item('c', [a])])
+        a.children.append(b)
+        with raises(RuntimeError, match='cycle reference detected'):
+            Tree.convert(a, name_handle, children_handle)
+
+    def test_convert_shared_items(self, name_handle, children_handle):
+        shared = self.Item('shared')
+        root = self.Item('root', [self.Item('a', [shared]), self.Item('b', [shared])])
+        tree = Tree.convert(root, name_handle, children_handle)
+        assert tree.render() == 'root\n├── a\n│   └── shared\n└── b\n    └── shared'
+
     def test_build_exceptions(self, testcase_exception_tree_items):
         items, rendered = testcase_exception_tree_items
         tree = Tree.build(items=items, naming='__name__', parent='__base__')
@@ -999,7 +1057,30 @@ class TestAttrEnum:
         with raises(KeyError):
             invalid = enum['__fields__']
 
-    @mark.xfail(reason="enum should have at least one member - see AttrEnum 'Deny reserved names' comment")
+    def test_custom_repr(self):
+        class BaseEnum(AttrEnum):
+            def __repr__(self):
+                return 'custom'
+
+        class DerivedEnum(BaseEnum):
+            __fields__ = 'a',
+            X = 1
+
+        class OwnReprEnum(AttrEnum):
+            __fields__ = 'a',
+            X = 1
+            def __repr__(self):
+                return 'own'
+
+        assert repr(DerivedEnum.X) == 'custom'
+        assert repr(OwnReprEnum.X) == 'own'
+
+    def test_functional_api(self):
+        enum = AttrEnum('FunctionalEnum', 'A B')
+        assert list(enum) == [enum.A, enum.B]
+        assert enum.B.index == 1
+        assert repr(enum.B) == "<FunctionalEnum.B: 2>"
+
     @mark.parametrize('name', ['name', '_sunder_', '__dunder__'])
     def test_invalid_field_no_members(self, name):
         with raises(ValueError):
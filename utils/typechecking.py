@@ -60,11 +60,15 @@ Supported type specifications:
     • `TypeVar`s
 """
 
-from inspect import signature
+from functools import lru_cache, wraps
+from inspect import BoundArguments, Parameter, signature
+from inspect import CO_ASYNC_GENERATOR, CO_COROUTINE, CO_GENERATOR
 from io import IOBase, TextIOBase, BufferedIOBase
+from types import FunctionType
 from typing import *
 from typing import IO, TextIO, BinaryIO, Match, Pattern
 from typing import _GenericAlias as GenericAlias
+from typing import _ProtocolMeta as ProtocolMeta
 from typing import _SpecialForm as SpecialForm
 from typing import _TypedDictMeta as TypedDictMeta
 
@@ -84,6 +88,12 @@ __all__ = ['check_args']
 NoneType = type(None)
 Typespec = Union[type, SpecialForm, GenericAlias, TypeVar]
 
+# Identities of most basic types, checked in a single hash lookup before any other typespec inspection
+basic_type_ids = frozenset(map(id, (str, int, float, bool, bytes, type, dict, tuple, list, set, NoneType)))
+
+# Code flags of functions that return generator / coroutine objects instead of running their body
+generator_code_flags = CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR
+
 IO_type_refs = {
     IO: IOBase,
     TextIO: TextIOBase,
@@ -103,6 +113,132 @@ def _format_type_(typevar: Typespec) -> str:
         return str(typevar).replace('typing.', '')
 
 
+def _is_bare_type_(typespec: Typespec) -> bool:
+    """
+    Return whether `typespec` is a bare type, so it could be typechecked by plain `isinstance()` call
+    `NamedTuple`, `TypedDict`s and `IO`s require special handling and are not considered bare types
+    """
+
+    if not isinstance(typespec, type):
+        return False
+    return not (typespec is NamedTuple or type(typespec) is TypedDictMeta or typespec in IO_type_refs)
+
+
+def _is_namedtuple_(cls: type) -> bool:
+    """
+    Infer whether `cls` is a `NamedTuple` class judging by `_fields` and `_field_defaults` attributes it adds
+    Subclasses of `NamedTuple` classes are recognized as well
+    """
+    return issubclass(cls, tuple) and hasattr(cls, '_fields') and hasattr(cls, '_field_defaults')
+
+
+@lru_cache(maxsize=None)
+def _bare_types_(typespecs: Tuple[Typespec, ...]) -> Optional[Tuple[type, ...]]:
+    """
+    Return `typespecs` if all of them are bare types, so they could be typechecked by a single `isinstance()` call
+    Returns `None` if any of `typespecs` requires special handling
+    Result is cached, so compound typespecs are inspected only once
+    """
+
+    if all(map(_is_bare_type_, typespecs)):
+        return typespecs
+    return None
+
+
+@lru_cache(maxsize=None)
+def _typeddict_fields_(typespec: TypedDictMeta) -> Dict[str, Typespec]:
+    """
+    Return mapping of keys to resolved annotations for given `TypedDict` subclass
+    Result is cached, so `get_type_hints()` is invoked only once per `TypedDict`
+    Returned mapping is shared across calls and should not be modified
+    """
+    return get_type_hints(typespec)
+
+
+@lru_cache(maxsize=1024)
+def _implements_protocol_(cls: type, protocol: ProtocolMeta) -> bool:
+    """
+    Return whether instances of `cls` implement `protocol` judging by their type alone, result is cached
+    Only protocols with method members are inferred this way, as it is how `Protocol.__instancecheck__()` works
+    Negative result is not definitive: instances may still provide protocol members via their own attributes
+    Protocols that do not support `issubclass()` (e.g. ones with data members) yield negative result as well
+    """
+
+    try:
+        return issubclass(cls, protocol)
+    except TypeError:
+        return False
+
+
+@lru_cache(maxsize=256)
+def _literal_values_(typeargs: tuple) -> Union[FrozenSet, tuple]:
+    """
+    Return arguments of `Literal[...]` typespec as a frozenset for constant-time membership tests
+    Falls back to `typeargs` tuple itself if some of the values are not hashable
+    """
+    try:
+        return frozenset(typeargs)
+    except TypeError:
+        return typeargs
+
+
+def _is_literal_(value: Any, typeargs: tuple) -> bool:
+    """Return whether `value` is one of `Literal[...]` typespec arguments"""
+    try:
+        return value in _literal_values_(typeargs)
+    except TypeError:
+        # Either `value` or one of `typeargs` is not hashable
+        return value in typeargs
+
+
+def _is_any_type_(value: Any, typespecs: Tuple[Typespec, ...], *, argname: str) -> bool:
+    """
+    Return whether `value` matches any of `typespecs`, never raises `TypecheckError`
+    Sets of bare types (like `Union` arguments or `TypeVar` constraints) are resolved once and then
+        checked by a single `isinstance()` call
+    """
+
+    if (bare_types := _bare_types_(typespecs)) is not None:
+        return isinstance(value, bare_types)
+    return any(_is_type_(value, typespec, argname=argname) for typespec in typespecs)
+
+
+def _is_type_(value: Any, typespec: Typespec, *, argname: str) -> bool:
+    """
+    Return whether `value` matches `typespec`, never raises `TypecheckError`
+    Intended for probing alternatives (like `Union` members) without exception-driven control flow
+    Bare types, `Any`, `TypeVar`s, `Union`s and `Literal`s are matched directly,
+        all other typespecs are delegated to `_check_type_()`
+    Invalid type specifications still raise `TypeError`
+    """
+
+    if typespec is Any:
+        return True
+
+    if id(typespec) in basic_type_ids or _is_bare_type_(typespec):
+        return isinstance(value, typespec)
+
+    if isinstance(typespec, TypeVar):
+        if typespec.__constraints__:
+            return _is_any_type_(value, typespec.__constraints__, argname=argname)
+        if typespec.__bound__ is not None:
+            return _is_type_(value, typespec.__bound__, argname=argname)
+        return True
+
+    if isinstance(typespec, GenericAlias):
+        if typespec.__origin__ is Union:
+            return _is_any_type_(value, typespec.__args__, argname=argname)
+        if typespec.__origin__ is Literal:
+            return _is_literal_(value, typespec.__args__)
+
+    try:
+        _check_type_(value, typespec, argname=argname)
+    except TypecheckError:
+        return False
+    else:
+        return True
+
+
 def _check_type_(value: Any, typespec: Typespec, *, argname: str):
     """
     Typecheck `value` against `typespec`
@@ -115,23 +251,22 @@ def _check_type_(value: Any, typespec: Typespec, *, argname: str):
     See module docstring for full list of supported type specifications
     """
 
+    # Fast-forward `Any`
+    if typespec is Any:
+        return
+
     # Fast-forward most basic types
-    if typespec in (str, int, float, bool, bytes, type, dict, tuple, list, set, NoneType):
+    if id(typespec) in basic_type_ids:
         if isinstance(value, typespec):
             return
         raise TypecheckError(value=value, exptype=typespec, varname=argname)
 
-    # Fast-forward `Any`
-    if typespec is Any:
-        return
-
     if isinstance(typespec, type):
         # `NamedTuple` itself is not a base type for NamedTuples, so it is not directly typecheckable,
         #   but it adds `_fields` and `_field_defaults` attributes which give a chance to guess
         if typespec is NamedTuple:
-            if value.__class__.__bases__ == (tuple,):
-                if hasattr(value, '_fields') and hasattr(value, '_field_defaults'):
-                    return  # infer that's a NamedTuple
+            if _is_namedtuple_(type(value)):
+                return
             raise TypecheckError(value=value, exptype=typespec, varname=argname)
 
         # `TypedDict` subclasses have `__annotations__` and `__total__` that allow for typechecking
@@ -145,18 +280,19 @@ def _check_type_(value: Any, typespec: Typespec, *, argname: str):
             if not isinstance(value, dict):
                 raise TypecheckError(value=value, exptype=dict, varname=argname)
 
-            annotations = get_type_hints(typespec)
+            annotations = _typeddict_fields_(typespec)
 
             # Check value has the same set of keys as specified in typespec
+            #   (dict views support set comparisons without materializing intermediate sets)
             if typespec.__total__ is True:
-                if (actual_keys := set(value.keys())) != (expected_keys := set(annotations.keys())):
+                if value.keys() != annotations.keys():
                     message = "{exptype} layout mismatch: " \
-                              f"expected ({', '.join(expected_keys)}), got ({', '.join(actual_keys)})"
+                              f"expected ({', '.join(annotations)}), got ({', '.join(value)})"
                     raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
             else:
-                if not (actual_keys := set(value.keys())).issubset(expected_keys := set(annotations.keys())):
+                if extra_keys := [key for key in value if key not in annotations]:
                     message = "{exptype} layout mismatch: " \
-                              f"extra keys: ({', '.join((actual_keys - expected_keys))})"
+                              f"extra keys: ({', '.join(extra_keys)})"
                     raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
 
             # Check type of each item in the dictionary
@@ -173,12 +309,16 @@ def _check_type_(value: Any, typespec: Typespec, *, argname: str):
             return
 
         # `IO` types are not actually base types for file objects, so they require special handling
-        if issubclass(typespec, IO):
+        if typespec in IO_type_refs:
             # CONSIDER: find better approach for checking IO and Type[IO]
-            if isinstance(value, IO_type_refs.get(typespec, object)):
+            if isinstance(value, IO_type_refs[typespec]):
                 return
             raise TypecheckError(value=value, exptype=typespec, varname=argname)
 
+        # Runtime-checkable `Protocol`s re-inspect protocol members on each check, so type-based result is cached
+        if type(typespec) is ProtocolMeta and _implements_protocol_(type(value), typespec):
+            return
+
         # All other `type`s are treated the usual way
         if isinstance(value, typespec):
             return
@@ -189,13 +329,8 @@ def _check_type_(value: Any, typespec: Typespec, *, argname: str):
         typespec: TypeVar
 
         if typespec.__constraints__:
-            for constraint in typespec.__constraints__:
-                try:
-                    _check_type_(value, constraint, argname=argname)
-                except TypecheckError:
-                    continue
-                else:
-                    return
+            if _is_any_type_(value, typespec.__constraints__, argname=argname):
+                return
             message = "{value!r:.100} does not match any constraint from" \
                       f" [{', '.join(map(_format_type_, typespec.__constraints__))}]"
             raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
@@ -219,25 +354,9 @@ def _check_type_(value: Any, typespec: Typespec, *, argname: str):
         if not typeargs:
             raise TypeError(f"argument '{argname}': bare {basetype._name} is invalid type specification")
 
-        if basetype is ClassVar or basetype is Final:
-            return _check_type_(value, typeargs[0], argname=argname)
-
-        if basetype is Literal:
-            if value in typeargs:
-                return
-            message = "{value!r:.100} does not match any value from {exptype}"
-            raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
-
-        if basetype is Union:
-            for typearg in typeargs:
-                try:
-                    _check_type_(value, typearg, argname=argname)
-                except TypecheckError:
-                    continue
-                else:
-                    return
-            message = "{value!r:.100} does not match any type specification from {exptype}"
-            raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
+        handler = special_form_handlers.get(basetype)
+        if handler is not None:
+            return handler(value, typespec, typeargs, argname=argname)
 
     # All other typespecs gonna have their basetype typechecked the usual way
     try:
@@ -253,77 +372,136 @@ def _check_type_(value: Any, typespec: Typespec, *, argname: str):
             message = f"{typespec} is not a valid type specification"
             raise TypeError(f"argument '{argname}': " + message) from None
 
-    # Check type arguments, if provided
+    # Check type arguments, if provided, with a handler specific to the typespec
     if typeargs:
-        # `Tuple` arguments define fixed structure, if not specified as homogeneous collection
-        if typespec._name == 'Tuple':
-            value: tuple
+        handler = generic_alias_handlers.get(typespec._name)
+        if handler is not None:
+            return handler(value, typespec, typeargs, argname=argname)
 
-            if len(typeargs) > 1 and typeargs[-1] is Ellipsis:
-                return  # dont inspect contents of collections of homogeneous type
 
-            if len(value) != len(typeargs):
-                message = f"tuple signature mismatch: required {len(typeargs)} arguments, got {len(value)}"
-                raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
+def _check_qualified_(value: Any, typespec: GenericAlias, typeargs: tuple, *, argname: str):
+    """Typecheck `value` against typespec wrapped into `ClassVar[...]` or `Final[...]` qualifier"""
+    return _check_type_(value, typeargs[0], argname=argname)
 
-            for i, (item, typearg) in enumerate(zip(value, typeargs), start=1):
-                try:
-                    _check_type_(item, typearg, argname=argname)
-                except TypecheckError:
-                    message = f"tuple signature mismatch: item #{i} =" " {value!r:.100} is not {exptype}"
-                    raise TypecheckError(message, value=item, exptype=typearg, varname=argname) from None
 
-            return  # return without error if all types have matched
+def _check_literal_(value: Any, typespec: GenericAlias, typeargs: tuple, *, argname: str):
+    """Check `value` is one of the values specified by `Literal[...]` typespec"""
+    if _is_literal_(value, typeargs):
+        return
+    message = "{value!r:.100} does not match any value from {exptype}"
+    raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
+
 
-        # `Type` argument defines type(s) for subclass check
-        if typespec._name == 'Type':
-            typearg = typeargs[0]
+def _check_union_(value: Any, typespec: GenericAlias, typeargs: tuple, *, argname: str):
+    """Typecheck `value` against any of the typespecs specified by `Union[...]` typespec"""
 
-            if typearg is Any:
-                return
+    if _is_any_type_(value, typeargs, argname=argname):
+        return
+    message = "{value!r:.100} does not match any type specification from {exptype}"
+    raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
 
-            if typearg is NamedTuple:
-                if value.__bases__ == (tuple,) and hasattr(value, '_fields') and hasattr(value, '_field_defaults'):
-                    return
 
-            if isinstance(typearg, GenericAlias):
-                typearg = typearg.__origin__
+# Handlers for checking subscripted `SpecialForm`s, keyed by the `SpecialForm` itself
+special_form_handlers = {
+    ClassVar: _check_qualified_,
+    Final: _check_qualified_,
+    Literal: _check_literal_,
+    Union: _check_union_,
+}
 
-            if not isinstance(typearg, type):
-                raise TypeError(f"argument '{argname}': type argument '{_format_type_(typearg)}' is not a type")
 
-            if issubclass(typearg, IO):
-                if issubclass(value, IO_type_refs.get(typespec, object)):
-                    return
-                raise TypecheckError("{value!r:.100} is not a subclass of {exptype}",
-                                     value=value, exptype=typearg, varname=argname)
+def _check_tuple_(value: tuple, typespec: GenericAlias, typeargs: tuple, *, argname: str):
+    """
+    Typecheck structure of `value` against arguments of `Tuple[...]` typespec
+    `Tuple` arguments define fixed structure, if not specified as homogeneous collection
+    """
 
-            if issubclass(value, typearg):
-                return
-            raise TypecheckError("{value!r:.100} is not a subclass of {exptype}",
-                                 value=value, exptype=typearg, varname=argname)
+    if len(typeargs) > 1 and typeargs[-1] is Ellipsis:
+        return  # dont inspect contents of collections of homogeneous type
 
-        # `Match` object conceals its type in `.string` attribute
-        if typespec._name == 'Match':
-            value: Match
-            return _check_type_(value.string, typeargs[0], argname=argname)
+    if len(value) != len(typeargs):
+        message = f"tuple signature mismatch: required {len(typeargs)} arguments, got {len(value)}"
+        raise TypecheckError(message, value=value, exptype=typespec, varname=argname)
 
-        # `Pattern` object conceals its type in `.pattern` attribute
-        if typespec._name == 'Pattern':
-            value: Pattern
-            return _check_type_(value.pattern, typeargs[0], argname=argname)
+    for i, (item, typearg) in enumerate(zip(value, typeargs), start=1):
+        try:
+            _check_type_(item, typearg, argname=argname)
+        except TypecheckError:
+            message = f"tuple signature mismatch: item #{i} =" " {value!r:.100} is not {exptype}"
+            raise TypecheckError(message, value=item, exptype=typearg, varname=argname) from None
+
+
+def _check_subclass_(value: type, typespec: GenericAlias, typeargs: tuple, *, argname: str):
+    """
+    Typecheck `value` against argument of `Type[...]` typespec
+    `Type` argument defines type(s) for subclass check
+    """
+
+    typearg = typeargs[0]
+
+    if typearg is Any:
+        return
+
+    if typearg is NamedTuple:
+        if _is_namedtuple_(value):
+            return
+
+    if isinstance(typearg, GenericAlias):
+        typearg = typearg.__origin__
+
+    if not isinstance(typearg, type):
+        raise TypeError(f"argument '{argname}': type argument '{_format_type_(typearg)}' is not a type")
+
+    if typearg in IO_type_refs:
+        if issubclass(value, IO_type_refs[typearg]):
+            return
+        raise TypecheckError("{value!r:.100} is not a subclass of {exptype}",
+                             value=value, exptype=typearg, varname=argname)
+
+    if issubclass(value, typearg):
+        return
+    raise TypecheckError("{value!r:.100} is not a subclass of {exptype}",
+                         value=value, exptype=typearg, varname=argname)
+
+
+def _check_match_(value: Match, typespec: GenericAlias, typeargs: tuple, *, argname: str):
+    """Typecheck `Match` object against `Match[...]` typespec, it conceals its type in `.string` attribute"""
+    return _check_type_(value.string, typeargs[0], argname=argname)
+
+
+def _check_pattern_(value: Pattern, typespec: GenericAlias, typeargs: tuple, *, argname: str):
+    """Typecheck `Pattern` object against `Pattern[...]` typespec, it conceals its type in `.pattern` attribute"""
+    return _check_type_(value.pattern, typeargs[0], argname=argname)
+
+
+# Handlers for checking type arguments of subscripted `GenericAlias`es, keyed by typespec name
+generic_alias_handlers = {
+    'Tuple': _check_tuple_,
+    'Type': _check_subclass_,
+    'Match': _check_match_,
+    'Pattern': _check_pattern_,
+}
 
 
 class TypecheckError(Exception):
-    """Runtime type checking failed"""
+    """
+    Runtime type checking failed
+    Error message is formatted only when requested, so errors that are caught and discarded cost no formatting
+    """
 
     def __init__(self, template: str = None, *, value: Any, exptype: Typespec, varname: str):
+        super().__init__()
+        self.template = template or "{value!r:.100} is not {exptype}"
         self.value = value
         self.typespec = exptype
-        if not template:
-            template = "{value!r:.100} is not {exptype}"
-        message = template.format(value=value, exptype=_format_type_(exptype), varname=varname)
-        super().__init__(f"argument '{varname}': " + message)
+        self.varname = varname
+
+    def __str__(self):
+        message = self.template.format(value=self.value, exptype=_format_type_(self.typespec), varname=self.varname)
+        return f"argument '{self.varname}': " + message
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({str(self)!r})'
 
 
 def check_args(*arguments: str, check_defaults: bool = False):
@@ -368,9 +546,10 @@ def check_args(*arguments: str, check_defaults: bool = False):
 
         # Fetch annotations from `function` reliably, even if it is classmethod or staticmethod
         if isinstance(wrapee, (classmethod, staticmethod)):
-            type_hints = get_type_hints(wrapee.__func__)
+            function = wrapee.__func__
         else:
-            type_hints = get_type_hints(wrapee)
+            function = wrapee
+        type_hints = get_type_hints(function)
 
         # Get annotations mapping for requested arguments
         if not argnames:
@@ -381,13 +560,10 @@ def check_args(*arguments: str, check_defaults: bool = False):
             for name in argnames:
                 if name not in type_hints:
                     raise ValueError(f"non-existent argument name '{name}'"
-                                     f" for function '{wrapee.__name__}'")
+                                     f" for function '{function.__name__}'")
                 annotations[name] = type_hints[name]
 
-        @decorator
-        def wrapper(func, instance, args, kwargs):
-            sign = signature(func)
-            parameters = sign.bind(*args, **kwargs)
+        def check_arguments(parameters: BoundArguments):
             if check_defaults:
                 parameters.apply_defaults()
             for argname, annotation in annotations.items():
@@ -396,11 +572,39 @@ def check_args(*arguments: str, check_defaults: bool = False):
                 except KeyError:
                     continue  # skip if argument is not provided and defaults are not checked
                 _check_type_(value, annotation, argname=argname)
+
+        # Plain functions are wrapped into a closure with signature fetched beforehand,
+        #   binding to instance / class is left to function itself or to its classmethod / staticmethod wrapper
+        # Generator and coroutine functions are left to `wrapt`, so that `inspect` still recognizes their kind
+        if isinstance(function, FunctionType) and not function.__code__.co_flags & generator_code_flags:
+            function_signature = signature(function)
+            bind = function_signature.bind
+
+            # The closure binds methods itself, so their receiver (`self` / `cls`) is excluded from checks
+            scope, _, _ = function.__qualname__.rpartition('.')
+            if scope and not scope.endswith('<locals>') and not isinstance(wrapee, staticmethod):
+                receiver = next(iter(function_signature.parameters.values()), None)
+                if receiver and receiver.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+                    annotations.pop(receiver.name, None)
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                check_arguments(bind(*args, **kwargs))
+                return function(*args, **kwargs)
+
+            if function is wrapee:
+                return wrapper
+            return type(wrapee)(wrapper)
+
+        # Other callables are wrapped by `wrapt`, which handles descriptor protocol of the wrapee properly
+        @decorator
+        def descriptor_wrapper(func, instance, args, kwargs):
+            check_arguments(signature(func).bind(*args, **kwargs))
             return func(*args, **kwargs)
 
-        return wrapper(wrapee)
+        return descriptor_wrapper(wrapee)
 
-    if arguments == () or isinstance(arguments[0], str):
+    if not arguments or isinstance(arguments[0], str):
         # Infer decorator is used with arguments, thus `arguments` is a tuple of argument names to be checked
         argnames = arguments
         return function_processor
@@ -7,15 +7,20 @@ Intended for use in both application development and interactive Python interpre
 from __future__ import annotations
 
 import re
+from collections import deque
 from contextlib import nullcontext
-from enum import Enum
-from itertools import islice, repeat, zip_longest
+from enum import Enum, EnumMeta
+from functools import lru_cache, wraps
+from inspect import CO_ASYNC_GENERATOR, CO_COROUTINE, CO_GENERATOR
+from itertools import chain
 from operator import attrgetter
 from subprocess import run
-from typing import NamedTuple, TypeVar, Dict, Tuple
+from types import FunctionType, WrapperDescriptorType
+from typing import NamedTuple, TypeVar, Dict, FrozenSet, Tuple
 from typing import Any, Callable, Iterable, Iterator, Type, List, Collection, Literal, Union
+from warnings import warn
 
-from wrapt import decorator
+from wrapt import FunctionWrapper, decorator
 
 
 # TODO: short module description, purpose
@@ -48,6 +53,16 @@ __all__ = [
 T = TypeVar('T')
 Decorator = Callable[[Callable], Callable]
 
+# Binary string representations of all byte values, indexed by byte value
+binary_octets: Tuple[str, ...] = tuple(f'{byte:08b}' for byte in range(256))
+
+# `stacklevel` pointing `deprecated()` warnings issued from `wrapt` wrapper function at the caller:
+#   `wrapt` C extension invokes wrapper function directly, its pure-Python fallback adds a `__call__()` frame
+wrapt_stacklevel: int = 2 if isinstance(FunctionWrapper.__call__, WrapperDescriptorType) else 3
+
+# Exact types that are never unpacked by `schain()`
+scalar_types: FrozenSet[type] = frozenset((str, int, float, complex, bool, type(None)))
+
 
 class test:
     """Sample collections namespace class"""
@@ -124,31 +139,20 @@ def bytewise(byteseq: bytes, sep: str = ' ', limit: int = None, show_len: bool =
     >>> assert bytewise(b'python', limit=5) == '70 79 74 .. 6E (6 bytes)'
     """
 
-    octets = map(''.join, zip(*repeat(iter(byteseq.hex().upper()), 2)))
-    if limit is None or len(byteseq) <= limit:
-        return sep.join(octets)
-    if limit < 2:
-        raise ValueError("cannot limit sequence to less than 2 bytes")
-    else:
-        head = islice(octets, limit - 2)  # account for last byte + '..'
+    if limit is not None and len(byteseq) > limit:
+        if limit < 2:
+            raise ValueError("cannot limit sequence to less than 2 bytes")
+        head = bytewise(byteseq[:limit - 2], sep)  # account for last byte + '..'
         last = byteseq[-1:].hex().upper()
         appendix = f' ({len(byteseq)} bytes)' if show_len else ''
-        return sep.join((*head, '..', last)) + appendix
-
-
-def bytewise2(byteseq: bytes, sep: str = ' ', limit: int = None, show_len: bool = True) -> str:
-    """More readable, but 2.5 times slower implementation of `bytewise()`"""
+        return sep.join((head, '..', last) if head else ('..', last)) + appendix
 
-    octets = (f'{byte:02X}' for byte in byteseq)
-    if limit is None or len(byteseq) <= limit:
-        return sep.join(octets)
-    if limit < 2:
-        raise ValueError("cannot limit sequence to less than 2 bytes")
-    else:
-        head = islice(octets, limit - 2)
-        last = f'{byteseq[-1]:02X}'
-        appendix = f' ({len(byteseq)} bytes)' if show_len else ''
-        return sep.join((*head, '..', last)) + appendix
+    # `bytes.hex()` inserts separators in one C-level pass, though it accepts only a single ASCII character
+    #   and its output needs uppercasing, so the actual `sep` is substituted for a space afterwards
+    if not sep:
+        return byteseq.hex().upper()
+    hexstr = byteseq.hex(' ').upper()
+    return hexstr if sep == ' ' else hexstr.replace(' ', sep)
 
 
 def bitwise(byteseq: bytes, sep: str = ' ') -> str:
@@ -157,7 +161,10 @@ def bitwise(byteseq: bytes, sep: str = ' ') -> str:
     >>> assert bitwise(b'abc') == '01100001 01100010 01100011'
     >>> assert bitwise(bytes.fromhex('00 0A FF')) == '00000000 00001010 11111111'
     """
-    return sep.join(f"{byte:08b}" for byte in byteseq)
+    if not sep and byteseq:
+        # Contiguous output is the whole sequence formatted as one zero-padded binary number
+        return format(int.from_bytes(byteseq, 'big'), f'0{len(byteseq) * 8}b')
+    return sep.join([binary_octets[byte] for byte in byteseq])
 
 
 def deprecated(reason: str) -> Decorator:
@@ -175,25 +182,52 @@ def deprecated(reason: str) -> Decorator:
 
     @decorator
     def deprecation_wrapper(wrapped, instance, args, kwargs):
-        from warnings import warn
         nonlocal details
-        wrapee = wrapped.__class__.__name__.replace('type', 'class')
-        message = f"{wrapee.capitalize()} '{wrapped.__name__}' is marked as deprecated"
-        if details:
-            message += f' ({details})'
-        warn(message, category=DeprecationWarning, stacklevel=3)
+        message = _deprecation_message_(wrapped.__class__.__name__, wrapped.__name__, details)
+        warn(message, category=DeprecationWarning, stacklevel=wrapt_stacklevel)
         return wrapped(*args, **kwargs)
 
+    def deprecate(wrapped):
+        # Descriptors, classes and other callables are handled by wrapt,
+        #   as well as functions defined in a class body, which are reported as methods once bound,
+        #   and generator / coroutine functions, so that `inspect` still recognizes their kind
+        if not isinstance(wrapped, FunctionType):
+            return deprecation_wrapper(wrapped)
+        if wrapped.__code__.co_flags & (CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR):
+            return deprecation_wrapper(wrapped)
+        scope, _, _ = wrapped.__qualname__.rpartition('.')
+        if scope and not scope.endswith('<locals>'):
+            return deprecation_wrapper(wrapped)
+
+        # Plain functions get a lightweight closure, which is bound as a method by itself
+        message = _deprecation_message_('function', wrapped.__name__, details)
+
+        @wraps(wrapped)
+        def function_wrapper(*args, **kwargs):
+            warn(message, category=DeprecationWarning, stacklevel=2)
+            return wrapped(*args, **kwargs)
+        return function_wrapper
+
     if isinstance(reason, str):
         # Infer decorator is used with an argument,
-        #   thus store `reason` in a closure from `deprecation_wrapper`
+        #   thus store `reason` in a closure from `deprecate`
         details = reason
-        return deprecation_wrapper
+        return deprecate
     else:
         # Infer decorator is used without arguments,
         #   in this case `reason` is expected to be an object to be wrapped
         details = ''
-        return deprecation_wrapper(reason)
+        return deprecate(reason)
+
+
+@lru_cache(maxsize=None)
+def _deprecation_message_(wrapee_type: str, name: str, details: str) -> str:
+    """Format `DeprecationWarning` message for `deprecated()` wrappers"""
+    wrapee = wrapee_type.replace('type', 'class')
+    message = f"{wrapee.capitalize()} '{name}' is marked as deprecated"
+    if details:
+        message += f' ({details})'
+    return message
 
 
 def autorepr(msg: str) -> Callable[[Any], str]:
@@ -206,9 +240,16 @@ def autorepr(msg: str) -> Callable[[Any], str]:
     "<utils.autorepr.<locals>.Belarus deserves respect at 0x...>"
     """
 
+    # Formatted representation prefixes for each class (and subclass) the method is used by
+    prefixes: Dict[type, str] = {}
+
     def __repr__(self):
         cls = self.__class__
-        return f"<{cls.__module__}.{cls.__qualname__} {msg} at {hex(id(self))}>"
+        try:
+            prefix = prefixes[cls]
+        except KeyError:
+            prefix = prefixes[cls] = f"<{cls.__module__}.{cls.__qualname__} {msg} at "
+        return f"{prefix}{hex(id(self))}>"
     return __repr__
 
 
@@ -221,27 +262,24 @@ def schain(*items: Union[T, Iterable[T]]) -> Iterator[T]:
     >>> assert [*schain(('foo', 'bar'), 'solid')] == ['foo', 'bar', 'solid'] # does not tear strings apart
     >>> assert [*schain(range(3), 3, [], 42)] == [0, 1, 2, 3, 42]  # iterables and items could go in any order
     """
-    for item in items:
-        if isinstance(item, str):
-            yield item
-        elif hasattr(item, '__iter__'):
-            yield from item
-        else:
-            yield item
+    return chain.from_iterable(
+        (item,) if type(item) in scalar_types or isinstance(item, str) or not hasattr(item, '__iter__') else item
+        for item in items
+    )
 
 
 def isdunder(name: str) -> bool:
     """Return whether `name` is a __double_underscore__ name (from `enum` module)"""
-    return (name[:2] == name[-2:] == '__' and
-            name[2:3] != '_' and name[-3:-2] != '_' and
-            len(name) > 4)
+    return (len(name) > 4 and
+            name[0] == name[1] == name[-2] == name[-1] == '_' and
+            name[2] != '_' and name[-3] != '_')
 
 
 def issunder(name: str) -> bool:
     """Return whether `name` is a _single_underscore_ name"""
-    return (name[:1] == name[-1:] == '_' and
-            name[1:2] != '_' and name[-2:-1] != '_' and
-            len(name) > 2)
+    return (len(name) > 2 and
+            name[0] == name[-1] == '_' and
+            name[1] != '_' and name[-2] != '_')
 
 
 def isiterable(obj) -> bool:
@@ -265,6 +303,8 @@ class Disposable:
     >>> assert obj.attr is None  # subsequent access returns None
     """
 
+    __slots__ = ('value',)
+
     def __init__(self, value=None):
         self.value = value
 
@@ -272,7 +312,8 @@ class Disposable:
         if instance is None:
             return self
         value = self.value
-        self.value = None
+        if value is not None:
+            self.value = None
         return value
 
     def __set__(self, instance, value):
@@ -294,16 +335,18 @@ class spy:
     >>> assert list(lookahead) == []  # exhausted
     """
 
+    __slots__ = ('source', 'cache')
+
     def __init__(self, iterable: Iterable[T]):
         self.source = iter(iterable)
-        self.cache = []
+        self.cache = deque()
 
     def __iter__(self):
         return self
 
     def __next__(self):
         if self.cache:
-            return self.cache.pop(0)
+            return self.cache.popleft()
         else:
             return next(self.source)
 
@@ -334,7 +377,7 @@ class GetterDescriptor:
     >>> assert instance.attr == '42'  # acquire modified
     """
 
-    # NOTE: __slots__ break dynamic docstrings
+    # NOTE: __slots__ break dynamic docstrings ('__doc__' slot conflicts with class docstring)
 
     def __init__(self, method):
         self.name: str
@@ -380,7 +423,7 @@ class SetterDescriptor:
     >>> assert instance.attr == '42'  # acquire unchanged
     """
 
-    # NOTE: __slots__ break dynamic docstrings
+    # NOTE: __slots__ break dynamic docstrings ('__doc__' slot conflicts with class docstring)
 
     def __init__(self, method):
         self.name: str
@@ -504,6 +547,8 @@ class ignore:
     Exception: message
     """
 
+    __slots__ = ('exctypes',)
+
     def __new__(cls, *args):
         if args == ():
             return nullcontext()
@@ -516,12 +561,16 @@ class ignore:
         pass
 
     def __exit__(self, exctype, exc, traceback):
-        return isinstance(exc, self.exctypes)
+        if exctype is None:
+            return False
+        return issubclass(exctype, self.exctypes)
 
 
 class classproperty:
     """Decorator implementing a class-level read-only property"""
 
+    # NOTE: __slots__ break dynamic docstrings ('__doc__' slot conflicts with class docstring)
+
     def __init__(self, method: Callable):
         self.getter = method
         self.__doc__ = method.__doc__
@@ -534,7 +583,7 @@ class Tree:
     """
     Tree structure converter and tree-style renderer
     Intended to be used mainly for display purposes
-    Does not handle cycle references for now
+    `convert()` raises `RuntimeError` on cycle references, `build()` and `render()` do not handle them for now
     >>> exceptions = [...]  # list of all python exceptions
     >>> tree = Tree.build(items=exceptions, naming='__name__', parents='__base__')
     >>> assert str(tree) == tree.render()
@@ -590,14 +639,20 @@ class Tree:
 
         line, fork, end, void = self.marker_styles[style]
 
-        def generate(nodes: List[Tree.Node], prefix: str = ''):
+        lines = [self.root.name]
+        append = lines.append
+
+        def generate(nodes: List[Tree.Node], prefix: str):
             last = len(nodes)-1
             for i, item in enumerate(nodes):
-                yield f'{prefix}{end if i is last else fork}{item.name}'
+                is_last = i == last
+                append(f'{prefix}{end if is_last else fork}{item.name}')
                 if item.nodes:
-                    yield from generate(item.nodes, prefix+(void if i is last else line))
+                    generate(item.nodes, prefix+(void if is_last else line))
+
+        generate(self.root.nodes, '')
 
-        return '\n'.join(schain(self.root.name, generate(self.root.nodes)))
+        return '\n'.join(lines)
 
     @classmethod
     def convert(cls, root: Item, naming: Union[str, NameHandle], children: Union[str, ChildrenHandle]) -> Tree:
@@ -610,20 +665,38 @@ class Tree:
             It could be whether a item's attribute name or a single-argument callable hook
         """
 
-        def get_children(node: cls.Item) -> List[cls.Node]:
-            children_nodes = children_handle(node)
-            if children_nodes is None:
-                return []
-            if not isinstance(children_nodes, Collection):
-                err_msg = f'children handle returned invalid result: expected List[Item], got {children_nodes!r}'
-                raise RuntimeError(err_msg)
-            return [cls.Node(name=name_handle(child), value=child, nodes=get_children(child))
-                    for child in children_nodes]
-
         children_handle = attrgetter(children) if isinstance(children, str) else children
         name_handle = attrgetter(naming) if isinstance(naming, str) else naming
+        Node = cls.Node
+
+        root_node = Node(name=name_handle(root), value=root, nodes=[])
+        # Pending entries are (node, entering) pairs, nodes are re-queued with entering=False
+        #   to mark the point where their subtree is done and they leave the ancestors set
+        pending = [(root_node, True)]
+        ancestors = set()  # ids of items on the path from the root down to the node being expanded
+        while pending:
+            node, entering = pending.pop()
+            item_id = id(node.value)
+            if not entering:
+                ancestors.remove(item_id)
+                continue
+            if item_id in ancestors:
+                raise RuntimeError(f"cycle reference detected: item {node.value!r} is its own descendant")
+            children_nodes = children_handle(node.value)
+            if children_nodes is None:
+                continue
+            try:
+                children_items = iter(children_nodes)
+            except TypeError:
+                err_msg = f'children handle returned invalid result: expected List[Item], got {children_nodes!r}'
+                raise RuntimeError(err_msg) from None
+            node.nodes.extend(Node(name=name_handle(child), value=child, nodes=[]) for child in children_items)
+            if node.nodes:
+                ancestors.add(item_id)
+                pending.append((node, False))
+                pending.extend((child, True) for child in node.nodes)
 
-        return cls(cls.Node(name=name_handle(root), value=root, nodes=get_children(root)))
+        return cls(root_node)
 
     @classmethod
     def build(cls, items: Iterable[Item], naming: Union[str, NameHandle],
@@ -662,13 +735,46 @@ class Tree:
             if parent_item:
                 nodes_index[parent_item].nodes.append(node)
 
+        name_key = attrgetter('name')
         for node in nodes_index.values():
-            node.nodes.sort(key=attrgetter('name'))
+            if len(node.nodes) > 1:
+                node.nodes.sort(key=name_key)
 
         return cls(root)
 
 
-class AttrEnum(Enum):
+class AttrEnumMeta(EnumMeta):
+    """
+    Metaclass for `AttrEnum`
+    Validates `__fields__` names once per enum class, before any of its members are created
+    Generates `__repr__` specialized for declared `__fields__`, unless the class defines or inherits a custom one
+    """
+
+    def __new__(metacls, cls, bases, classdict, **kwds):
+        fields = classdict.get('__fields__', ())
+        for name in fields:
+            if name.startswith('_') or name.endswith('_') or name == 'name':
+                raise ValueError(f"invalid field name '{name}'")
+
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwds)
+
+        if fields and enum_class.__repr__ is AttrEnum.__repr__:
+            template = '<{}.{}: ' + ', '.join(f'{name}={{!r}}' for name in fields) + '>'
+            getter = attrgetter(*fields)
+
+            if len(fields) == 1:
+                def __repr__(self):
+                    return template.format(self.__class__.__name__, self._name_, getter(self))
+            else:
+                def __repr__(self):
+                    return template.format(self.__class__.__name__, self._name_, *getter(self))
+
+            enum_class.__repr__ = __repr__
+
+        return enum_class
+
+
+class AttrEnum(Enum, metaclass=AttrEnumMeta):
     """
     Enum with custom attributes + an automatic `.index` attribute
     `AttrEnum` attributes are declared by assigning desired names to special `__fields__` variable
@@ -725,32 +831,36 @@ class AttrEnum(Enum):
 
     def __new__(cls, *args):
         obj = object.__new__(cls)
+        fields = cls.__fields__
 
         # If __fields__ are not provided, just set .index
         #   and leave .value to be defined by Enum internals
-        if not cls.__fields__:
+        if not fields:
             obj.index = len(cls.__members__)
             return obj
 
-        # Deny reserved names
-        # (this check is performed redundantly during creation of each enum member,
-        #   but adding a custom metaclass for performing it just once does not seem like a wonderful idea)
-        for name in cls.__fields__:
-            if name.startswith('_') or name.endswith('_') or name == 'name':
-                raise ValueError(f"invalid field name '{name}'")
+        # Reserved names are denied by AttrEnumMeta once per class
 
         # Freak out if specified member attrs exceed number of fields
-        if len(args) > len(cls.__fields__):
+        if len(args) > len(fields):
             err_msg = "enum member has too many attrs: expected {n_fields}, got {n_args}"
-            raise ValueError(err_msg.format(n_fields=len(cls.__fields__), n_args=len(args)))
+            raise ValueError(err_msg.format(n_fields=len(fields), n_args=len(args)))
+
+        # Fill missing values up to the number of fields
+        values = args + (None,) * (len(fields) - len(args))
 
         # Assign .value and .index with values from attrs, or defaults if not provided
-        attrs: dict = dict(zip_longest(cls.__fields__, args))
-        obj._value_ = attrs.pop('value', tuple(attrs.values()) if len(attrs) > 1 else args[0])
-        obj.index = attrs.pop('index', len(cls.__members__))
+        if 'value' in fields:
+            obj._value_ = values[fields.index('value')]
+        else:
+            obj._value_ = values if len(values) > 1 else values[0]
+        if 'index' in fields:
+            obj.index = values[fields.index('index')]
+        else:
+            obj.index = len(cls.__members__)
 
         # Set specified attrs
-        obj.__dict__.update(attrs)
+        obj.__dict__.update((name, value) for name, value in zip(fields, values) if name not in ('value', 'index'))
 
         return obj
 